@@ -1,38 +1,200 @@
+import hashlib
+import os
+from functools import lru_cache
+
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
+from plotly_resampler.aggregation import MinMaxLTTB
+import orjson
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import qualitative
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # SciPy is optional; numba compiles the same recurrence instead
+    lfilter = None
+    from numba import njit
 
-# Generate dummy data
-np.random.seed(42)
-dates = pd.date_range(start="2023-01-01", end="2023-12-31", freq='M')
 products = ['Pet Food', 'Confectionary', 'Other Food Product']
 
-data = {
-    'Product': np.random.choice(products, len(dates)),
-    'Date': dates,
-    'Sales': np.random.randint(10000, 50000, len(dates)),
-    'Paid_Search_Spend': np.random.randint(500, 5000, len(dates)),
-    'Banner_Ads_Spend': np.random.randint(300, 3000, len(dates)),
-    'Impressions_Paid_Search': np.random.randint(10000, 50000, len(dates)),
-    'Impressions_Banner_Ads': np.random.randint(8000, 40000, len(dates)),
-    'Clicks_Paid_Search': np.random.randint(500, 5000, len(dates)),
-    'Clicks_Banner_Ads': np.random.randint(300, 3000, len(dates)),
-    'Conversions_Paid_Search': np.random.randint(50, 500, len(dates)),
-    'Conversions_Banner_Ads': np.random.randint(30, 300, len(dates)),
-    'Customer_Loyalty': np.random.uniform(0, 1, len(dates)),
-    'Perfect_Store_Score': np.random.uniform(0, 1, len(dates))
-}
+# Optional pre-built dataset, written by write_data_file() with the final dtypes already applied.
+# Each worker still loads its own copy; the file only saves regenerating and re-casting the data.
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data.parquet')
+
+
+@lru_cache(maxsize=1)
+def _load_df():
+    if os.path.exists(DATA_FILE):
+        # memory_map lets pyarrow read straight from the OS page cache instead of a buffered copy
+        frame = pd.read_parquet(DATA_FILE, memory_map=True)
+        missing = [col for col in ['Product', 'Date'] + INT_COLUMNS + FLOAT_COLUMNS if col not in frame.columns]
+        if missing:
+            raise ValueError(f"{DATA_FILE} is missing columns: {', '.join(missing)}")
+        # Files not written by write_data_file() still need the categorical and 32-bit dtypes
+        return frame if _is_prepared(frame) else _prepare(frame)
+    return _generate_df()
+
+
+def write_data_file(path=DATA_FILE):
+    # Run once per deploy: python -c "import wireframe; wireframe.write_data_file()"
+    _generate_df().to_parquet(path, index=False)
+
+
+def _generate_df():
+    # Generate dummy data
+    rng = np.random.RandomState(42)
+    dates = pd.date_range(start="2023-01-01", end="2023-12-31", freq='M')
+
+    data = {
+        'Product': rng.choice(products, len(dates)),
+        'Date': dates,
+        'Sales': rng.randint(10000, 50000, len(dates)),
+        'Paid_Search_Spend': rng.randint(500, 5000, len(dates)),
+        'Banner_Ads_Spend': rng.randint(300, 3000, len(dates)),
+        'Impressions_Paid_Search': rng.randint(10000, 50000, len(dates)),
+        'Impressions_Banner_Ads': rng.randint(8000, 40000, len(dates)),
+        'Clicks_Paid_Search': rng.randint(500, 5000, len(dates)),
+        'Clicks_Banner_Ads': rng.randint(300, 3000, len(dates)),
+        'Conversions_Paid_Search': rng.randint(50, 500, len(dates)),
+        'Conversions_Banner_Ads': rng.randint(30, 300, len(dates)),
+        'Customer_Loyalty': rng.uniform(0, 1, len(dates)),
+        'Perfect_Store_Score': rng.uniform(0, 1, len(dates))
+    }
+
+    return _prepare(pd.DataFrame(data))
+
+
+INT_COLUMNS = [
+    'Sales', 'Paid_Search_Spend', 'Banner_Ads_Spend',
+    'Impressions_Paid_Search', 'Impressions_Banner_Ads',
+    'Clicks_Paid_Search', 'Clicks_Banner_Ads',
+    'Conversions_Paid_Search', 'Conversions_Banner_Ads'
+]
+FLOAT_COLUMNS = ['Customer_Loyalty', 'Perfect_Store_Score']
+
+
+def _is_prepared(frame):
+    return (
+        isinstance(frame['Product'].dtype, pd.CategoricalDtype)
+        and (frame[INT_COLUMNS].dtypes == np.int32).all()
+        and (frame[FLOAT_COLUMNS].dtypes == np.float32).all()
+    )
+
+
+def _prepare(frame):
+    # Dictionary-encode Product so isin and groupby work on integer codes
+    frame['Product'] = frame['Product'].astype('category')
+    # Every metric fits in 32 bits, halving the bytes each vectorized pass touches
+    frame[INT_COLUMNS] = frame[INT_COLUMNS].astype(np.int32)
+    frame[FLOAT_COLUMNS] = frame[FLOAT_COLUMNS].astype(np.float32)
+    return frame
+
+
+df = _load_df()
+
+# Content fingerprint of df; part of every memoized key so a new dataset never hits old entries
+DATA_VERSION = hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
+
+# Adstock: y[i] = x[i] + ab * y[i-1], where ab = alpha * beta
+if lfilter is not None:
+    def _adstock(x, ab):
+        return lfilter([1.0], [1.0, -ab], x)
+else:
+    @njit(cache=True, fastmath=True)
+    def _adstock(x, ab):
+        out = np.empty_like(x)
+        if x.size == 0:
+            return out
+        out[0] = x[0]
+        for i in range(1, x.size):
+            out[i] = x[i] + ab * out[i - 1]
+        return out
+
+    # Compile now so the first request doesn't pay for it
+    _adstock(np.zeros(2), 0.0)
+
+# Row positions of each product, in date order
+_product_rows = {}
+# Each row's product code and its position within that product's history
+_product_codes = df['Product'].cat.codes.to_numpy()
+_product_positions = np.empty(len(df), dtype=np.intp)
+for prod in df['Product'].cat.categories:
+    rows = np.flatnonzero((df['Product'] == prod).to_numpy())
+    rows = rows[np.argsort(df['Date'].to_numpy()[rows], kind='stable')]
+    _product_rows[prod] = rows
+    _product_positions[rows] = np.arange(rows.size)
+
+
+@lru_cache(maxsize=4096)
+def _adstock_cached(product, column, ab_q):
+    # Adstock over a product's full history; only depends on alpha * beta, not on the filters
+    out = _adstock(df[column].to_numpy()[_product_rows[product]].astype(np.float64), ab_q)
+    out.setflags(write=False)
+    return out
+
+
+def _adstock_rows(column, ab, rows):
+    # Only the products present in rows are looked up, straight into an output of len(rows)
+    ab_q = round(ab, 3)
+    out = np.empty(len(rows))
+    codes = _product_codes[rows]
+    for code in np.unique(codes):
+        sel = codes == code
+        out[sel] = _adstock_cached(df['Product'].cat.categories[code], column, ab_q)[_product_positions[rows[sel]]]
+    return out
+
+
+# Largest number of points sent to the browser per trace
+MAX_POINTS = 1000
+_aggregator = MinMaxLTTB()
+
+
+def _downsample(x, y):
+    # LTTB keeps the visual shape of the series while capping the payload; x is epoch ms,
+    # so the irregular gaps left by the filters are taken into account
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if y.size <= MAX_POINTS:
+        return dict(x=x, y=y)
+    idx = _aggregator.arg_downsample(x, y, n_out=MAX_POINTS)
+    return dict(x=x[idx], y=y[idx])
 
-df = pd.DataFrame(data)
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 
+# Shared across workers, unlike an in-process lru_cache
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.cache',
+    'CACHE_DEFAULT_TIMEOUT': 3600
+})
+
+
+# Figure layouts, validated once at import and resolved (default template included) to plain dicts
+ADSTOCK_LAYOUT = go.Figure().update_layout(barmode='overlay', title='Adstock Effect Over Time', xaxis_title='Date', xaxis_type='date', yaxis_title='Ad Spend', legend_title='Legend').to_dict()['layout']
+DIMINISHING_LAYOUT = go.Figure().update_layout(title='Diminishing Returns Over Time', xaxis_title='Date', xaxis_type='date', yaxis_title='Spend', legend_title='Legend').to_dict()['layout']
+SALES_AD_SPEND_LAYOUT = go.Figure().update_layout(title='Sales and Advertising Spend Over Time', xaxis_title='Date', xaxis_type='date', yaxis_title='Value', legend_title='Legend').to_dict()['layout']
+BUDGET_PRODUCT_LAYOUT = go.Figure().update_layout(title='Budget Distribution by Product', xaxis_title='Date', xaxis_type='date', yaxis_title='Spend', legend_title='Product').to_dict()['layout']
+BUDGET_AD_LAYOUT = go.Figure().update_layout(title='Budget Distribution Between Ad Types', xaxis_title='Date', xaxis_type='date', yaxis_title='Spend', legend_title='Legend').to_dict()['layout']
+UPLIFT_LAYOUT = go.Figure().update_layout(title='Uplift in Sales Over Time', xaxis_title='Date', xaxis_type='date', yaxis_title='Sales', legend_title='Legend').to_dict()['layout']
+
+# Fixed colour per product, picked by category code, so filtering never reassigns them
+PRODUCT_COLORS = {prod: qualitative.Plotly[code % len(qualitative.Plotly)] for code, prod in enumerate(df['Product'].cat.categories)}
+
+# Layouts for the figures built in the browser
+clientside_layouts = {
+    'sales-ad-spend-graph': SALES_AD_SPEND_LAYOUT,
+    'budget-ad-graph': BUDGET_AD_LAYOUT,
+    'uplift-graph': UPLIFT_LAYOUT
+}
+
 app.layout = dbc.Container([
     dbc.Row([
         dbc.Col(html.H1("Marketing Mix Modeling Dashboard"), width=12)
@@ -61,15 +223,15 @@ app.layout = dbc.Container([
         ], width=2),
         dbc.Col([
             dbc.Label("Budget Threshold"),
-            dcc.Input(id='budget-input', type='number', value=1000)
+            dcc.Input(id='budget-input', type='number', value=1000, debounce=True)
         ], width=2),
         dbc.Col([
             dbc.Label("Alpha"),
-            dcc.Slider(id='alpha-slider', min=0.0, max=1.0, step=0.1, value=0.5)
+            dcc.Slider(id='alpha-slider', min=0.0, max=1.0, step=0.1, value=0.5, updatemode='mouseup')
         ], width=2),
         dbc.Col([
             dbc.Label("Beta"),
-            dcc.Slider(id='beta-slider', min=0.0, max=1.0, step=0.1, value=0.5)
+            dcc.Slider(id='beta-slider', min=0.0, max=1.0, step=0.1, value=0.5, updatemode='mouseup')
         ], width=2),
         dbc.Col([
             dbc.Label("Date Range"),
@@ -93,90 +255,175 @@ app.layout = dbc.Container([
     ]),
     dbc.Row([
         dbc.Col(dcc.Graph(id='uplift-graph'), width=12),
-    ])
+    ]),
+    dcc.Store(id='filtered-store'),
+    dcc.Store(id='clientside-layouts', data=clientside_layouts)
 ], fluid=True)
 
-# Callback to update graphs based on inputs
+# Filtered data shared by the graph callbacks below
 @app.callback(
-    [Output('adstock-graph', 'figure'),
-     Output('diminishing-graph', 'figure'),
-     Output('sales-ad-spend-graph', 'figure'),
-     Output('budget-product-graph', 'figure'),
-     Output('budget-ad-graph', 'figure'),
-     Output('uplift-graph', 'figure')],
+    Output('filtered-store', 'data'),
     [Input('objective-dropdown', 'value'),
      Input('product-dropdown', 'value'),
      Input('budget-input', 'value'),
-     Input('alpha-slider', 'value'),
-     Input('beta-slider', 'value'),
      Input('date-picker-range', 'start_date'),
      Input('date-picker-range', 'end_date')]
 )
-def update_graphs(objective, selected_products, budget_threshold, alpha, beta, start_date, end_date):
-    filtered_df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
-    filtered_df = filtered_df[filtered_df['Product'].isin(selected_products)]
-    filtered_df = filtered_df[(filtered_df['Paid_Search_Spend'] + filtered_df['Banner_Ads_Spend']) >= budget_threshold]
-    
-    # Adstock calculation
-    def adstock(series, alpha, beta):
-        result = [series.iloc[0]]
-        for i in range(1, len(series)):
-            result.append(series.iloc[i] + alpha * result[i-1] * beta)
-        return result
-
-    filtered_df['Adstock_Paid_Search'] = adstock(filtered_df['Paid_Search_Spend'], alpha, beta)
-    filtered_df['Adstock_Banner_Ads'] = adstock(filtered_df['Banner_Ads_Spend'], alpha, beta)
-
-    # Diminishing returns
-    filtered_df['Diminishing_Paid_Search'] = filtered_df['Paid_Search_Spend'] ** alpha
-    filtered_df['Diminishing_Banner_Ads'] = filtered_df['Banner_Ads_Spend'] ** beta
-
-    # Adstock graph
-    fig_adstock = go.Figure()
-    fig_adstock.add_trace(go.Bar(x=filtered_df['Date'], y=filtered_df['Paid_Search_Spend'], name='Initial Advertising (Paid Search)', marker_color='lightgreen'))
-    fig_adstock.add_trace(go.Bar(x=filtered_df['Date'], y=filtered_df['Banner_Ads_Spend'], name='Initial Advertising (Banner Ads)', marker_color='lightblue'))
-    fig_adstock.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Adstock_Paid_Search'], mode='lines', name='Adstocked Advertising (Paid Search)', line=dict(color='green', width=2)))
-    fig_adstock.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Adstock_Banner_Ads'], mode='lines', name='Adstocked Advertising (Banner Ads)', line=dict(color='blue', width=2)))
-
-    fig_adstock.update_layout(barmode='overlay')
-    fig_adstock.update_traces(opacity=0.6)
-    fig_adstock.update_layout(title='Adstock Effect Over Time', xaxis_title='Date', yaxis_title='Ad Spend', legend_title='Legend')
-
-    # Diminishing returns graph
-    fig_diminishing = go.Figure()
-    fig_diminishing.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Diminishing_Paid_Search'], mode='lines', name='Diminishing Paid Search', line=dict(color='green', width=2)))
-    fig_diminishing.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Diminishing_Banner_Ads'], mode='lines', name='Diminishing Banner Ads', line=dict(color='blue', width=2)))
-
-    fig_diminishing.update_layout(title='Diminishing Returns Over Time', xaxis_title='Date', yaxis_title='Spend', legend_title='Legend')
-
-    # Sales and Ad Spend graph
-    fig_sales_ad = go.Figure()
-    fig_sales_ad.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Sales'], mode='lines', name='Sales', line=dict(color='black', width=2)))
-    fig_sales_ad.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Paid_Search_Spend'], mode='lines', name='Paid Search Spend', line=dict(color='green', width=2)))
-    fig_sales_ad.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Banner_Ads_Spend'], mode='lines', name='Banner Ads Spend', line=dict(color='blue', width=2)))
-
-    fig_sales_ad.update_layout(title='Sales and Advertising Spend Over Time', xaxis_title='Date', yaxis_title='Value', legend_title='Legend')
-
-    # Budget distribution by product
-    fig_budget_product = px.line(filtered_df, x='Date', y=['Paid_Search_Spend', 'Banner_Ads_Spend'], color='Product')
-
-    fig_budget_product.update_layout(title='Budget Distribution by Product', xaxis_title='Date', yaxis_title='Spend', legend_title='Product')
-
-    # Budget distribution between ad types
-    fig_budget_ad = go.Figure()
-    fig_budget_ad.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Paid_Search_Spend'], mode='lines', name='Paid Search Spend', line=dict(color='green', width=2)))
-    fig_budget_ad.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Banner_Ads_Spend'], mode='lines', name='Banner Ads Spend', line=dict(color='blue', width=2)))
-
-    fig_budget_ad.update_layout(title='Budget Distribution Between Ad Types', xaxis_title='Date', yaxis_title='Spend', legend_title='Legend')
-
-    # Uplift graph
-    fig_uplift = go.Figure()
-    fig_uplift.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Sales'], mode='lines', name='Actual Sales', line=dict(color='black', width=2)))
-    fig_uplift.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Sales'] * (1 + alpha), mode='lines', name='Uplifted Sales', line=dict(color='red', width=2, dash='dash')))
-
-    fig_uplift.update_layout(title='Uplift in Sales Over Time', xaxis_title='Date', yaxis_title='Sales', legend_title='Legend')
-
-    return fig_adstock, fig_diminishing, fig_sales_ad, fig_budget_product, fig_budget_ad, fig_uplift
+def update_filtered_store(objective, selected_products, budget_threshold, start_date, end_date):
+    return _filter(DATA_VERSION, objective, tuple(sorted(selected_products)), budget_threshold, start_date, end_date)
+
+
+# source_check folds _filter's source into the key, so entries from older code are not reused
+@cache.memoize(source_check=True)
+def _filter(data_version, objective, selected_products, budget_threshold, start_date, end_date):
+    # Single boolean mask over the raw arrays instead of three intermediate frames
+    dates = df['Date'].to_numpy()
+    mask = (
+        (dates >= pd.Timestamp(start_date).to_datetime64())
+        & (dates <= pd.Timestamp(end_date).to_datetime64())
+        & df['Product'].isin(selected_products).to_numpy()
+        # numexpr fuses the add and compare into one pass without a temporary sum
+        & df.eval('Paid_Search_Spend + Banner_Ads_Spend >= @budget_threshold').to_numpy()
+    )
+    # Kept rows come straight from the column arrays, so no filtered DataFrame is built.
+    # Encoded once with orjson and cached as a string; dates travel as epoch milliseconds
+    return orjson.dumps({
+        'Date': dates[mask].astype('datetime64[ms]').view(np.int64),
+        'Product': df['Product'].to_numpy()[mask].tolist(),
+        'Sales': df['Sales'].to_numpy()[mask],
+        'Paid_Search_Spend': df['Paid_Search_Spend'].to_numpy()[mask],
+        'Banner_Ads_Spend': df['Banner_Ads_Spend'].to_numpy()[mask],
+        'Row': np.flatnonzero(mask)
+    }, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+# Adstock graph
+@app.callback(
+    Output('adstock-graph', 'figure'),
+    [Input('filtered-store', 'data'),
+     Input('alpha-slider', 'value'),
+     Input('beta-slider', 'value')]
+)
+def update_adstock_graph(store, alpha, beta):
+    data = orjson.loads(store)
+    rows = np.asarray(data['Row'], dtype=np.intp)
+    adstock_paid_search = _adstock_rows('Paid_Search_Spend', alpha * beta, rows)
+    adstock_banner_ads = _adstock_rows('Banner_Ads_Spend', alpha * beta, rows)
+
+    # Plain dicts skip go.Figure validation; dcc.Graph takes them as they are
+    return {
+        'data': [
+            {'type': 'bar', **_downsample(data['Date'], data['Paid_Search_Spend']), 'name': 'Initial Advertising (Paid Search)', 'marker': {'color': 'lightgreen'}, 'opacity': 0.6},
+            {'type': 'bar', **_downsample(data['Date'], data['Banner_Ads_Spend']), 'name': 'Initial Advertising (Banner Ads)', 'marker': {'color': 'lightblue'}, 'opacity': 0.6},
+            {'type': 'scatter', **_downsample(data['Date'], adstock_paid_search), 'mode': 'lines', 'name': 'Adstocked Advertising (Paid Search)', 'line': {'color': 'green', 'width': 2}, 'opacity': 0.6},
+            {'type': 'scatter', **_downsample(data['Date'], adstock_banner_ads), 'mode': 'lines', 'name': 'Adstocked Advertising (Banner Ads)', 'line': {'color': 'blue', 'width': 2}, 'opacity': 0.6}
+        ],
+        'layout': ADSTOCK_LAYOUT
+    }
+
+
+# Diminishing returns graph
+@app.callback(
+    Output('diminishing-graph', 'figure'),
+    [Input('filtered-store', 'data'),
+     Input('alpha-slider', 'value'),
+     Input('beta-slider', 'value')]
+)
+def update_diminishing_graph(store, alpha, beta):
+    data = orjson.loads(store)
+    diminishing_paid_search = np.power(np.asarray(data['Paid_Search_Spend']), alpha, dtype=np.float64)
+    diminishing_banner_ads = np.power(np.asarray(data['Banner_Ads_Spend']), beta, dtype=np.float64)
+
+    return {
+        'data': [
+            {'type': 'scatter', **_downsample(data['Date'], diminishing_paid_search), 'mode': 'lines', 'name': 'Diminishing Paid Search', 'line': {'color': 'green', 'width': 2}},
+            {'type': 'scatter', **_downsample(data['Date'], diminishing_banner_ads), 'mode': 'lines', 'name': 'Diminishing Banner Ads', 'line': {'color': 'blue', 'width': 2}}
+        ],
+        'layout': DIMINISHING_LAYOUT
+    }
+
+
+# Sales and Ad Spend graph, drawn in the browser
+app.clientside_callback(
+    """
+    function(store, layouts) {
+        const data = JSON.parse(store);
+        return {
+            data: [
+                {type: 'scatter', x: data.Date, y: data.Sales, mode: 'lines', name: 'Sales', line: {color: 'black', width: 2}},
+                {type: 'scatter', x: data.Date, y: data.Paid_Search_Spend, mode: 'lines', name: 'Paid Search Spend', line: {color: 'green', width: 2}},
+                {type: 'scatter', x: data.Date, y: data.Banner_Ads_Spend, mode: 'lines', name: 'Banner Ads Spend', line: {color: 'blue', width: 2}}
+            ],
+            layout: JSON.parse(JSON.stringify(layouts['sales-ad-spend-graph']))
+        };
+    }
+    """,
+    Output('sales-ad-spend-graph', 'figure'),
+    Input('filtered-store', 'data'),
+    State('clientside-layouts', 'data')
+)
+
+
+# Budget distribution by product
+@app.callback(
+    Output('budget-product-graph', 'figure'),
+    Input('filtered-store', 'data')
+)
+def update_budget_product_graph(store):
+    data = orjson.loads(store)
+    filtered_df = pd.DataFrame(data)
+    traces = []
+    for prod, sub in filtered_df.groupby('Product', sort=False):
+        # One legend entry per product, as px.line(color='Product') gave; dash tells the ad types apart
+        color = PRODUCT_COLORS[prod]
+        traces.append({'type': 'scattergl', **_downsample(sub['Date'], sub['Paid_Search_Spend']), 'mode': 'lines', 'name': prod, 'legendgroup': prod,
+                       'line': {'color': color}, 'hovertemplate': 'Paid Search Spend: %{y}'})
+        traces.append({'type': 'scattergl', **_downsample(sub['Date'], sub['Banner_Ads_Spend']), 'mode': 'lines', 'name': prod, 'legendgroup': prod,
+                       'showlegend': False, 'line': {'color': color, 'dash': 'dash'}, 'hovertemplate': 'Banner Ads Spend: %{y}'})
+    return {'data': traces, 'layout': BUDGET_PRODUCT_LAYOUT}
+
+
+# Budget distribution between ad types, drawn in the browser
+app.clientside_callback(
+    """
+    function(store, layouts) {
+        const data = JSON.parse(store);
+        return {
+            data: [
+                {type: 'scatter', x: data.Date, y: data.Paid_Search_Spend, mode: 'lines', name: 'Paid Search Spend', line: {color: 'green', width: 2}},
+                {type: 'scatter', x: data.Date, y: data.Banner_Ads_Spend, mode: 'lines', name: 'Banner Ads Spend', line: {color: 'blue', width: 2}}
+            ],
+            layout: JSON.parse(JSON.stringify(layouts['budget-ad-graph']))
+        };
+    }
+    """,
+    Output('budget-ad-graph', 'figure'),
+    Input('filtered-store', 'data'),
+    State('clientside-layouts', 'data')
+)
+
+
+# Uplift graph, drawn in the browser so alpha changes never reach the server.
+# Only the uplifted trace depends on alpha, but a server-side Patch would just add a round trip.
+app.clientside_callback(
+    """
+    function(store, alpha, layouts) {
+        const data = JSON.parse(store);
+        return {
+            data: [
+                {type: 'scatter', x: data.Date, y: data.Sales, mode: 'lines', name: 'Actual Sales', line: {color: 'black', width: 2}},
+                {type: 'scatter', x: data.Date, y: data.Sales.map(s => s * (1 + alpha)), mode: 'lines', name: 'Uplifted Sales', line: {color: 'red', width: 2, dash: 'dash'}}
+            ],
+            layout: JSON.parse(JSON.stringify(layouts['uplift-graph']))
+        };
+    }
+    """,
+    Output('uplift-graph', 'figure'),
+    Input('filtered-store', 'data'),
+    Input('alpha-slider', 'value'),
+    State('clientside-layouts', 'data')
+)
+
 
 if __name__ == '__main__':
     app.run_server(debug=True,port=4000)